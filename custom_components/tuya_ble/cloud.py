@@ -7,10 +7,11 @@ and retrieval for Tuya BLE devices within Home Assistant.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import time
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import (
@@ -66,15 +67,19 @@ class TuyaCloudCacheItem:
         api: TuyaOpenAPI instance or None.
         login: Dictionary containing login information.
         credentials: Dictionary mapping device MAC addresses to their credentials.
+        fetched_at: Monotonic timestamp of the last successful credentials fetch.
+        devices_url: Devices list URL formatted once per login session.
 
     """
 
     api: TuyaOpenAPI | None
     login_credentials: dict[str, Any]
-    devices_credentials: dict[str, dict[str, Any]]
+    devices_credentials: dict[str, TuyaBLEDeviceCredentials]
+    fetched_at: float = 0.0
+    devices_url: str | None = None
 
 
-CONF_TUYA_LOGIN_KEYS = [
+CONF_TUYA_LOGIN_KEYS = (
     CONF_ENDPOINT,
     CONF_ACCESS_ID,
     CONF_ACCESS_SECRET,
@@ -83,9 +88,9 @@ CONF_TUYA_LOGIN_KEYS = [
     CONF_PASSWORD,
     CONF_COUNTRY_CODE,
     CONF_APP_TYPE,
-]
+)
 
-CONF_TUYA_DEVICE_KEYS = [
+CONF_TUYA_DEVICE_KEYS = (
     CONF_UUID,
     CONF_LOCAL_KEY,
     CONF_DEVICE_ID,
@@ -94,9 +99,39 @@ CONF_TUYA_DEVICE_KEYS = [
     CONF_DEVICE_NAME,
     CONF_PRODUCT_NAME,
     CONF_PRODUCT_MODEL,
-]
+)
+
+# Frozenset of the login keys for C-level presence checks.
+_LOGIN_KEYS_SET = frozenset(CONF_TUYA_LOGIN_KEYS)
+
+# Device keys in TuyaBLEDeviceCredentials constructor order.
+_CREDENTIALS_FIELD_KEYS = (
+    CONF_UUID,
+    CONF_LOCAL_KEY,
+    CONF_DEVICE_ID,
+    CONF_CATEGORY,
+    CONF_PRODUCT_ID,
+    CONF_DEVICE_NAME,
+    CONF_PRODUCT_MODEL,
+    CONF_PRODUCT_NAME,
+)
+
+# How long fetched device credentials stay fresh before a refill is allowed.
+CACHE_TTL_SECONDS = 10 * 60
+
+_cache: dict[tuple[Any, ...], TuyaCloudCacheItem] = {}
+
+# Reverse index from device MAC address to the cache key of the login
+# that owns it, maintained by _fill_cache_item.
+_address_index: dict[str, tuple[Any, ...]] = {}
+
+# In-flight logins keyed by cache key, so concurrent callers with the
+# same account share a single TuyaOpenAPI.connect round trip.
+_login_inflight: dict[tuple[Any, ...], asyncio.Future[dict[Any, Any]]] = {}
 
-_cache: dict[str, TuyaCloudCacheItem] = {}
+# Per-cache-key locks serializing refills, so simultaneous device
+# discoveries trigger a single devices/factory-info fetch.
+_fill_locks: dict[tuple[Any, ...], asyncio.Lock] = {}
 
 
 class HASSTuyaBLEDeviceManager(AbstaractTuyaBLEDeviceManager):
@@ -119,23 +154,36 @@ class HASSTuyaBLEDeviceManager(AbstaractTuyaBLEDeviceManager):
         """
         self._hass = hass
         self._data = data
+        self._cache_key: tuple[Any, ...] | None = None
 
     @staticmethod
     def _is_login_success(response: dict[Any, Any]) -> bool:
         return bool(response.get(TUYA_RESPONSE_SUCCESS, False))
 
     @staticmethod
-    def _get_cache_key(data: dict[str, Any]) -> str:
-        key_dict = {key: data.get(key) for key in CONF_TUYA_LOGIN_KEYS}
-        return json.dumps(key_dict)
+    def _is_cache_item_fresh(item: TuyaCloudCacheItem) -> bool:
+        return (
+            len(item.devices_credentials) > 0
+            and time.monotonic() - item.fetched_at < CACHE_TTL_SECONDS
+        )
 
     @staticmethod
-    def _has_login_credentials(data: dict[Any, Any]) -> bool:
-        return all(data.get(key) is not None for key in CONF_TUYA_LOGIN_KEYS)
+    def _get_cache_key(data: dict[str, Any]) -> tuple[Any, ...]:
+        return tuple(data.get(key) for key in CONF_TUYA_LOGIN_KEYS)
+
+    def _get_own_cache_key(self) -> tuple[Any, ...]:
+        if self._cache_key is None:
+            self._cache_key = self._get_cache_key(self._data)
+        return self._cache_key
+
+    def _invalidate_own_cache_key(self) -> None:
+        self._cache_key = None
 
     @staticmethod
-    def _has_credentials(data: dict[Any, Any]) -> bool:
-        return all(data.get(key) is not None for key in CONF_TUYA_DEVICE_KEYS)
+    def _has_login_credentials(data: dict[Any, Any]) -> bool:
+        return _LOGIN_KEYS_SET.issubset(data) and all(
+            data.get(key) is not None for key in CONF_TUYA_LOGIN_KEYS
+        )
 
     async def login_with_credentials(
         self, data: dict[str, Any], add_to_cache: bool = False
@@ -151,11 +199,12 @@ class HASSTuyaBLEDeviceManager(AbstaractTuyaBLEDeviceManager):
             Dictionary containing the response from the Tuya cloud API.
 
         """
-        _LOGGER.debug(
-            "Attempting login with data: %s\nadd_to_cache: %s",
-            {key: data.get(key) for key in CONF_TUYA_LOGIN_KEYS},
-            add_to_cache,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Attempting login with data: %s\nadd_to_cache: %s",
+                {key: data.get(key) for key in CONF_TUYA_LOGIN_KEYS},
+                add_to_cache,
+            )
         if len(data) == 0:
             return {}
 
@@ -176,34 +225,59 @@ class HASSTuyaBLEDeviceManager(AbstaractTuyaBLEDeviceManager):
         )
         api.set_dev_channel("hass")
 
-        response = await self._hass.async_add_executor_job(
-            api.connect,
-            data.get(CONF_USERNAME, ""),
-            data.get(CONF_PASSWORD, ""),
-            data.get(CONF_COUNTRY_CODE, ""),
-            data.get(CONF_APP_TYPE, ""),
-        )
+        auth_type = data.get(CONF_AUTH_TYPE)
+        if type(auth_type) is AuthType:
+            data[CONF_AUTH_TYPE] = auth_type.value
+            if data is self._data:
+                self._invalidate_own_cache_key()
+        cache_key = self._get_cache_key(data)
+
+        in_flight = _login_inflight.get(cache_key)
+        if in_flight is not None:
+            _LOGGER.debug("Sharing in-flight login for cache key: %s", cache_key)
+            return await in_flight
+
+        future: asyncio.Future[dict[Any, Any]] = self._hass.loop.create_future()
+        _login_inflight[cache_key] = future
+        try:
+            response = await self._hass.async_add_executor_job(
+                api.connect,
+                data.get(CONF_USERNAME, ""),
+                data.get(CONF_PASSWORD, ""),
+                data.get(CONF_COUNTRY_CODE, ""),
+                data.get(CONF_APP_TYPE, ""),
+            )
 
-        if self._is_login_success(response):
-            _LOGGER.debug("Successful login for %s", data[CONF_USERNAME])
-            if add_to_cache:
-                auth_type = data[CONF_AUTH_TYPE]
-                if type(auth_type) is AuthType:
-                    data[CONF_AUTH_TYPE] = auth_type.value
-                cache_key = self._get_cache_key(data)
-                cache_item = _cache.get(cache_key)
-                if cache_item:
-                    cache_item.api = api
-                    cache_item.login_credentials = data
-                else:
-                    _cache[cache_key] = TuyaCloudCacheItem(api, data, {})
-                await self._fill_cache_item(_cache[cache_key])
+            if self._is_login_success(response):
+                _LOGGER.debug("Successful login for %s", data[CONF_USERNAME])
+                if add_to_cache:
+                    cache_item = _cache.get(cache_key)
+                    if cache_item:
+                        cache_item.api = api
+                        cache_item.login_credentials = data
+                    else:
+                        _cache[cache_key] = TuyaCloudCacheItem(api, data, {})
+                    _cache[cache_key].devices_url = (
+                        TUYA_API_DEVICES_URL % api.token_info.uid
+                    )
+                    await self._fill_cache_item_locked(cache_key, _cache[cache_key])
+        except BaseException as error:
+            future.set_exception(error)
+            # Mark the exception as retrieved: when no concurrent caller
+            # joined the single-flight, nobody awaits this future and
+            # asyncio would otherwise log "exception was never retrieved"
+            # on GC for routine login failures.
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+        finally:
+            _login_inflight.pop(cache_key, None)
 
         return response
 
     def _check_login(self) -> bool:
-        cache_key = self._get_cache_key(self._data)
-        return _cache.get(cache_key) is not None
+        return _cache.get(self._get_own_cache_key()) is not None
 
     async def login_with_stored_credentials(
         self, add_to_cache: bool = False
@@ -221,7 +295,18 @@ class HASSTuyaBLEDeviceManager(AbstaractTuyaBLEDeviceManager):
         _LOGGER.debug("Initiating login with internal data: %s", self._data)
         return await self.login_with_credentials(self._data, add_to_cache)
 
-    async def _fill_cache_item(self, item: TuyaCloudCacheItem) -> None:
+    async def _fill_cache_item_locked(
+        self, cache_key: tuple[Any, ...], item: TuyaCloudCacheItem
+    ) -> None:
+        lock = _fill_locks.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            # The first caller fills the item; later ones see it fresh.
+            if not self._is_cache_item_fresh(item):
+                await self._fill_cache_item(cache_key, item)
+
+    async def _fill_cache_item(
+        self, cache_key: tuple[Any, ...], item: TuyaCloudCacheItem
+    ) -> None:
         _LOGGER.debug(
             "Filling cache item for user: %s", item.login_credentials.get(CONF_USERNAME)
         )
@@ -231,99 +316,99 @@ class HASSTuyaBLEDeviceManager(AbstaractTuyaBLEDeviceManager):
 
         devices_response = await self._hass.async_add_executor_job(
             item.api.get,
-            TUYA_API_DEVICES_URL % (item.api.token_info.uid),
+            item.devices_url or TUYA_API_DEVICES_URL % (item.api.token_info.uid),
         )
         if devices_response.get(TUYA_RESPONSE_SUCCESS):
             devices = devices_response.get(TUYA_RESPONSE_RESULT)
             if isinstance(devices, Iterable):
-                for device in devices:
-                    fi_response = await self._hass.async_add_executor_job(
-                        item.api.get,
-                        TUYA_API_FACTORY_INFO_URL % (device.get("id")),
+                item.fetched_at = time.monotonic()
+                devices_by_id = {
+                    device.get("id"): device for device in devices if device.get("id")
+                }
+                if not devices_by_id:
+                    return
+                # The factory-infos endpoint accepts a comma-joined id
+                # list, so all devices are resolved in one request.
+                fi_response = await self._hass.async_add_executor_job(
+                    item.api.get,
+                    TUYA_API_FACTORY_INFO_URL % (",".join(devices_by_id)),
+                )
+                fi_response_result = fi_response.get(TUYA_RESPONSE_RESULT) or []
+                for factory_info in fi_response_result:
+                    device = devices_by_id.get(factory_info.get("id"))
+                    if device is None or TUYA_FACTORY_INFO_MAC not in factory_info:
+                        continue
+                    raw_mac = factory_info[TUYA_FACTORY_INFO_MAC].upper()
+                    mac = (
+                        f"{raw_mac[0:2]}:{raw_mac[2:4]}:{raw_mac[4:6]}:"
+                        f"{raw_mac[6:8]}:{raw_mac[8:10]}:{raw_mac[10:12]}"
                     )
-                    fi_response_result = fi_response.get(TUYA_RESPONSE_RESULT)
-                    if fi_response_result and len(fi_response_result) > 0:
-                        factory_info = fi_response_result[0]
-                        if factory_info and (TUYA_FACTORY_INFO_MAC in factory_info):
-                            mac = ":".join(
-                                factory_info[TUYA_FACTORY_INFO_MAC][i : i + 2]
-                                for i in range(0, 12, 2)
-                            ).upper()
-                            item.devices_credentials[mac] = {
-                                CONF_ADDRESS: mac,
-                                CONF_UUID: device.get("uuid"),
-                                CONF_LOCAL_KEY: device.get("local_key"),
-                                CONF_DEVICE_ID: device.get("id"),
-                                CONF_CATEGORY: device.get("category"),
-                                CONF_PRODUCT_ID: device.get("product_id"),
-                                CONF_DEVICE_NAME: device.get("name"),
-                                CONF_PRODUCT_MODEL: device.get("model"),
-                                CONF_PRODUCT_NAME: device.get("product_name"),
-                            }
-                    _LOGGER.debug(
-                        "Cache item filled for %s: %s",
-                        item.login_credentials.get(CONF_USERNAME),
-                        list(item.devices_credentials.keys()),
+                    item.devices_credentials[mac] = TuyaBLEDeviceCredentials(
+                        device.get("uuid") or "",
+                        device.get("local_key") or "",
+                        device.get("id") or "",
+                        device.get("category") or "",
+                        device.get("product_id") or "",
+                        device.get("name"),
+                        device.get("model"),
+                        device.get("product_name"),
                     )
+                    _address_index[mac] = cache_key
+                _LOGGER.debug(
+                    "Cache item filled for %s: %s",
+                    item.login_credentials.get(CONF_USERNAME),
+                    list(item.devices_credentials.keys()),
+                )
+
+    async def _build_cache_entry(self, entry_id: str, data: dict[str, Any]) -> None:
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Processing config entry %s with data: %s",
+                entry_id,
+                {key: data.get(key) for key in CONF_TUYA_LOGIN_KEYS},
+            )
+        key = self._get_cache_key(data)
+        if None in key:
+            # The key doubles as the login-completeness check: a None
+            # component means the entry has no usable login credentials.
+            return
+        item = _cache.get(key)
+        if (
+            item is None or len(item.devices_credentials) == 0
+        ) and self._is_login_success(
+            await self.login_with_credentials(data, add_to_cache=True)
+        ):
+            _LOGGER.debug(
+                "Login successful for config entry %s, updating cache for key: %s",
+                entry_id,
+                key,
+            )
+            item = _cache.get(key)
+            if item:
+                await self._fill_cache_item_locked(key, item)
 
     async def build_cache(self) -> None:
         """
         Build and populate the cache with Tuya BLE device credentials.
 
-        Iterates through Tuya and BLE config entries, logs in if necessary,
-        and fills the cache with device credentials.
+        Processes Tuya and BLE config entries concurrently, logs in if
+        necessary, and fills the cache with device credentials.
         """
         _LOGGER.debug("Building cache with current configuration entries.")
-        data = {}
         tuya_config_entries = self._hass.config_entries.async_entries(TUYA_DOMAIN)
-        for config_entry in tuya_config_entries:
-            _LOGGER.debug(
-                "Processing Tuya config entry %s with data: %s",
-                config_entry.entry_id,
-                {key: config_entry.data.get(key) for key in CONF_TUYA_LOGIN_KEYS},
-            )
-            data.clear()
-            data.update(config_entry.data)
-            key = self._get_cache_key(data)
-            item = _cache.get(key)
-            if (
-                item is None or len(item.devices_credentials) == 0
-            ) and self._is_login_success(
-                await self.login_with_credentials(data, add_to_cache=True)
-            ):
-                _LOGGER.debug(
-                    "Login successful for config entry %s, updating cache for key: %s",
-                    config_entry.entry_id,
-                    key,
-                )
-                item = _cache.get(key)
-                if item and len(item.devices_credentials) == 0:
-                    await self._fill_cache_item(item)
-
         ble_config_entries = self._hass.config_entries.async_entries(DOMAIN)
-        for config_entry in ble_config_entries:
-            _LOGGER.debug(
-                "Processing BLE config entry %s with options: %s",
-                config_entry.entry_id,
-                {key: config_entry.options.get(key) for key in CONF_TUYA_LOGIN_KEYS},
-            )
-            data.clear()
-            data.update(config_entry.options)
-            key = self._get_cache_key(data)
-            item = _cache.get(key)
-            if (
-                item is None or len(item.devices_credentials) == 0
-            ) and self._is_login_success(
-                await self.login_with_credentials(data, add_to_cache=True)
-            ):
-                _LOGGER.debug(
-                    "Login successful for BLE config entry %s, updating cache for key: %s",
-                    config_entry.entry_id,
-                    key,
+        await asyncio.gather(
+            *(
+                self._build_cache_entry(config_entry.entry_id, dict(config_entry.data))
+                for config_entry in tuya_config_entries
+            ),
+            *(
+                self._build_cache_entry(
+                    config_entry.entry_id, dict(config_entry.options)
                 )
-                item = _cache.get(key)
-                if item and len(item.devices_credentials) == 0:
-                    await self._fill_cache_item(item)
+                for config_entry in ble_config_entries
+            ),
+        )
 
     def get_login_from_cache(self) -> None:
         """
@@ -334,6 +419,7 @@ class HASSTuyaBLEDeviceManager(AbstaractTuyaBLEDeviceManager):
         """
         for cache_item in _cache.values():
             self._data.update(cache_item.login_credentials)
+            self._invalidate_own_cache_key()
             break
 
     async def get_device_credentials(
@@ -360,42 +446,44 @@ class HASSTuyaBLEDeviceManager(AbstaractTuyaBLEDeviceManager):
             force_update,
             save_data,
         )
-        credentials: dict[str, Any] | None = None
+        result: TuyaBLEDeviceCredentials | None = None
         item: TuyaCloudCacheItem | None = None
 
         cache_key = None
-        if self._has_credentials(self._data) and not force_update:
+        if not force_update and None not in (
+            values := tuple(self._data.get(key) for key in _CREDENTIALS_FIELD_KEYS)
+        ):
             _LOGGER.debug("Credentials found in internal data, using them directly.")
-            credentials = self._data.copy()
+            result = TuyaBLEDeviceCredentials(*values)
         else:
             if self._has_login_credentials(self._data):
                 _LOGGER.debug(
                     "Login credentials found in internal data, looking for cache key."
                 )
-                cache_key = self._get_cache_key(self._data)
+                cache_key = self._get_own_cache_key()
             else:
                 _LOGGER.debug(
                     "No login credentials in internal data, searching cache for address: %s",
                     address,
                 )
-                cache_key = next(
-                    (
-                        key
-                        for key, cache_item in _cache.items()
-                        if cache_item.devices_credentials.get(address)
-                    ),
-                    None,
-                )
+                cache_key = _address_index.get(address)
             _LOGGER.debug("Cache key determined: %s", cache_key)
             item = _cache.get(cache_key) if cache_key else None
-            _LOGGER.debug(
-                "Cache item retrieved for key %s: %s",
-                cache_key,
-                {key: item.login_credentials.get(key) for key in CONF_TUYA_LOGIN_KEYS}
-                if item
-                else None,
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Cache item retrieved for key %s: %s",
+                    cache_key,
+                    {
+                        key: item.login_credentials.get(key)
+                        for key in CONF_TUYA_LOGIN_KEYS
+                    }
+                    if item
+                    else None,
+                )
 
+            if force_update and item:
+                # Drop cached credentials so the login below refetches them.
+                item.devices_credentials.clear()
             if (force_update or item is None) and self._is_login_success(
                 await self.login_with_stored_credentials(add_to_cache=True)
             ):
@@ -407,36 +495,30 @@ class HASSTuyaBLEDeviceManager(AbstaractTuyaBLEDeviceManager):
                 if not item and cache_key:
                     _cache[cache_key] = TuyaCloudCacheItem(None, self._data.copy(), {})
                     item = _cache[cache_key]
-                if item:
-                    await self._fill_cache_item(item)
+                if item and cache_key:
+                    await self._fill_cache_item_locked(cache_key, item)
 
-            credentials = item.devices_credentials.get(address) if item else None
+            result = item.devices_credentials.get(address) if item else None
 
-        if not credentials:
+        if not result:
             return None
 
-        result = TuyaBLEDeviceCredentials(
-            credentials.get(CONF_UUID, ""),
-            credentials.get(CONF_LOCAL_KEY, ""),
-            credentials.get(CONF_DEVICE_ID, ""),
-            credentials.get(CONF_CATEGORY, ""),
-            credentials.get(CONF_PRODUCT_ID, ""),
-            credentials.get(CONF_DEVICE_NAME, ""),
-            credentials.get(CONF_PRODUCT_MODEL, ""),
-            credentials.get(CONF_PRODUCT_NAME, ""),
-        )
-        _LOGGER.debug(
-            "Device credentials retrieved for address %s: %s",
-            address,
-            {key: credentials.get(key) for key in CONF_TUYA_DEVICE_KEYS},
-        )
-        if save_data:
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Device credentials retrieved for address %s: %s",
+                address,
+                result.describe(),
+            )
+        if save_data and item:
+            # Credentials read straight from internal data need no
+            # write-back; only cache hits do.
             _LOGGER.debug(
                 "Updating internal data with credentials for address: %s", address
             )
-            if item:
-                self._data.update(item.login_credentials)
-            self._data.update(credentials)
+            self._data.update(item.login_credentials)
+            self._data[CONF_ADDRESS] = address
+            self._data.update(asdict(result))
+            self._invalidate_own_cache_key()
 
         return result
 
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 from typing import Any
 
-import pycountry
 import voluptuous as vol
 from homeassistant.components.bluetooth import (
     BluetoothServiceInfoBleak,
@@ -40,12 +41,48 @@ from .const import (
     TUYA_RESPONSE_MSG,
     TUYA_RESPONSE_SUCCESS,
     TUYA_SMART_APP,
+    Country,
 )
 from .devices import TuyaBLEData, get_device_readable_name
 from .tuya_ble import SERVICE_UUID, TuyaBLEDeviceCredentials
 
 _LOGGER = logging.getLogger(__name__)
 
+# Country lookup tables built once at import time. Country codes can be
+# duplicated, so setdefault keeps the first entry in list order.
+_COUNTRIES_BY_NAME = {country.name: country for country in TUYA_COUNTRIES}
+_COUNTRIES_BY_CODE: dict[str, Country] = {}
+for _country in TUYA_COUNTRIES:
+    _COUNTRIES_BY_CODE.setdefault(_country.country_code, _country)
+
+_COUNTRY_NAMES: tuple[str, ...] = tuple(country.name for country in TUYA_COUNTRIES)
+
+# We don't pass a dict {code:name} because country codes can be duplicate.
+# Keying by name keeps the dropdown order while giving vol.In O(1)
+# membership instead of scanning a 200-entry sequence per validation.
+_COUNTRY_NAME_SELECTOR = vol.In({name: name for name in _COUNTRY_NAMES})
+
+# Free-text login form fields, in display order.
+_LOGIN_TEXT_FIELDS = (
+    CONF_ACCESS_ID,
+    CONF_ACCESS_SECRET,
+    CONF_USERNAME,
+    CONF_PASSWORD,
+)
+
+_BLANK_LOGIN_DEFAULTS = dict.fromkeys(_LOGIN_TEXT_FIELDS, "")
+
+
+@functools.lru_cache(maxsize=512)
+def _country_name_for_alpha2(code: str | None) -> str | None:
+    """Resolve an ISO alpha-2 code to a country name, memoized."""
+    # Imported lazily: pycountry loads its country database on first
+    # access and is only needed once the login form is rendered.
+    import pycountry  # noqa: PLC0415
+
+    country = pycountry.countries.get(alpha_2=code)
+    return country.name if country else None
+
 
 async def _try_login(
     manager: HASSTuyaBLEDeviceManager,
@@ -56,11 +93,7 @@ async def _try_login(
     response: dict[Any, Any] | None
     data: dict[str, Any]
 
-    country = next(
-        country
-        for country in TUYA_COUNTRIES
-        if country.name == user_input[CONF_COUNTRY_CODE]
-    )
+    country = _COUNTRIES_BY_NAME[user_input[CONF_COUNTRY_CODE]]
 
     data = {
         CONF_ENDPOINT: country.endpoint,
@@ -106,45 +139,30 @@ def _show_login_form(
         "Showing login form with user input: %s, errors: %s", user_input, errors
     )
     if user_input is not None and user_input.get(CONF_COUNTRY_CODE) is not None:
-        for country in TUYA_COUNTRIES:
-            if country.country_code == user_input[CONF_COUNTRY_CODE]:
-                user_input[CONF_COUNTRY_CODE] = country.name
-                break
+        country = _COUNTRIES_BY_CODE.get(user_input[CONF_COUNTRY_CODE])
+        if country:
+            user_input[CONF_COUNTRY_CODE] = country.name
 
     def_country_name: str | None = None
     try:
-        def_country = pycountry.countries.get(alpha_2=flow_handler.hass.config.country)
-        if def_country:
-            def_country_name = def_country.name
+        def_country_name = _country_name_for_alpha2(flow_handler.hass.config.country)
     except AttributeError:
         msg = "Failed to get default country"
         raise RuntimeError(msg) from None
 
+    defaults = {**_BLANK_LOGIN_DEFAULTS, **user_input}
     return flow_handler.async_show_form(
         step_id="login",
         data_schema=vol.Schema(
             {
                 vol.Required(
                     CONF_COUNTRY_CODE,
-                    default=user_input.get(CONF_COUNTRY_CODE, def_country_name),
-                ): vol.In(
-                    # We don't pass a dict {code:name} because country codes
-                    # can be duplicate.
-                    [country.name for country in TUYA_COUNTRIES]
-                ),
-                vol.Required(
-                    CONF_ACCESS_ID, default=user_input.get(CONF_ACCESS_ID, "")
-                ): str,
-                vol.Required(
-                    CONF_ACCESS_SECRET,
-                    default=user_input.get(CONF_ACCESS_SECRET, ""),
-                ): str,
-                vol.Required(
-                    CONF_USERNAME, default=user_input.get(CONF_USERNAME, "")
-                ): str,
-                vol.Required(
-                    CONF_PASSWORD, default=user_input.get(CONF_PASSWORD, "")
-                ): str,
+                    default=defaults.get(CONF_COUNTRY_CODE, def_country_name),
+                ): _COUNTRY_NAME_SELECTOR,
+                **{
+                    vol.Required(field, default=defaults[field]): str
+                    for field in _LOGIN_TEXT_FIELDS
+                },
             }
         ),
         errors=errors,
@@ -174,13 +192,14 @@ class TuyaBLEOptionsFlow(OptionsFlowWithConfigEntry):
         errors: dict[str, str] = {}
         placeholders: dict[str, Any] = {}
         credentials: TuyaBLEDeviceCredentials | None = None
-        address: str | None = self.config_entry.data.get(CONF_ADDRESS)
+        config_entry = self.config_entry
+        address: str | None = config_entry.data.get(CONF_ADDRESS)
 
         if user_input is not None:
             entry: TuyaBLEData | None = None
             domain_data = self.hass.data.get(DOMAIN)
             if domain_data:
-                entry = domain_data.get(self.config_entry.entry_id)
+                entry = domain_data.get(config_entry.entry_id)
             if entry:
                 login_data = await _try_login(
                     entry.manager,
@@ -196,14 +215,14 @@ class TuyaBLEOptionsFlow(OptionsFlowWithConfigEntry):
                     )
                     if credentials:
                         return self.async_create_entry(
-                            title=self.config_entry.title,
+                            title=config_entry.title,
                             data=entry.manager.data,
                         )
                     errors["base"] = "device_not_registered"
 
         if user_input is None:
             user_input = {}
-            user_input.update(self.config_entry.options)
+            user_input.update(config_entry.options)
 
         return _show_login_form(self, user_input, errors, placeholders)
 
@@ -219,10 +238,28 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
         _LOGGER.debug("Initializing TuyaBLEConfigFlow")
         self._discovery_info: BluetoothServiceInfoBleak | None = None
         self._discovered_devices: dict[str, BluetoothServiceInfoBleak] = {}
+        self._discovery_scanned = False
+        self._name_cache: dict[str, str] = {}
         self._data: dict[str, Any] = {}
         self._manager: HASSTuyaBLEDeviceManager | None = None
         self._get_device_info_error = False
 
+    def _get_manager(self) -> HASSTuyaBLEDeviceManager:
+        """Return the device manager, creating it on first use."""
+        if self._manager is None:
+            self._manager = HASSTuyaBLEDeviceManager(self.hass, self._data)
+        return self._manager
+
+    async def _get_readable_name(
+        self, discovery_info: BluetoothServiceInfoBleak
+    ) -> str:
+        """Resolve a device's readable name, cached per flow instance."""
+        name = self._name_cache.get(discovery_info.address)
+        if name is None:
+            name = await get_device_readable_name(discovery_info, self._get_manager())
+            self._name_cache[discovery_info.address] = name
+        return name
+
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
     ) -> ConfigFlowResult:
@@ -230,18 +267,20 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
         _LOGGER.debug(
             "Starting Bluetooth discovery step with device: %s", discovery_info.address
         )
+        # Settle the unique id first: already-configured devices abort
+        # here without any cloud work. Only then start warming the
+        # credentials cache, overlapped with the remaining bookkeeping;
+        # the readable name below needs the cache, so the task is
+        # awaited before resolving it.
         await self.async_set_unique_id(discovery_info.address)
         self._abort_if_unique_id_configured()
+        manager = self._get_manager()
+        cache_task = self.hass.async_create_task(manager.build_cache())
         self._discovery_info = discovery_info
-        if self._manager is None:
-            self._manager = HASSTuyaBLEDeviceManager(self.hass, self._data)
-        await self._manager.build_cache()
+        await cache_task
 
         self.context["title_placeholders"] = {
-            "name": await get_device_readable_name(
-                discovery_info,
-                self._manager,
-            )
+            "name": await self._get_readable_name(discovery_info)
         }
         return await self.async_step_login()
 
@@ -250,9 +289,7 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         """Handle the user step for manual configuration of Tuya BLE integration."""
         _LOGGER.debug("Starting user initiated config flow with input: %s", user_input)
-        if self._manager is None:
-            self._manager = HASSTuyaBLEDeviceManager(self.hass, self._data)
-        await self._manager.build_cache()
+        await self._get_manager().build_cache()
         return await self.async_step_login()
 
     async def async_step_login(
@@ -263,21 +300,21 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
         data: dict[str, Any] | None = None
         errors: dict[str, str] = {}
         placeholders: dict[str, Any] = {}
-
-        if self._manager is None:
-            msg = "Device manager is not initialized"
-            raise RuntimeError(msg)
+        manager = self._get_manager()
 
         if user_input is not None:
             _LOGGER.debug("Attempting login with user input: %s", user_input)
             data = await _try_login(
-                self._manager,
+                manager,
                 user_input,
                 errors,
                 placeholders,
             )
             if data:
                 self._data.update(data)  # save data for future use
+                # Names resolved before login lack product details; let the
+                # device step re-resolve them with credentials available.
+                self._name_cache.clear()
                 _LOGGER.debug("Login successful, proceeding to device selection")
                 return await self.async_step_device()
         else:
@@ -286,14 +323,14 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
             )
             user_input = {}
             if self._discovery_info:
-                await self._manager.get_device_credentials(
+                await manager.get_device_credentials(
                     self._discovery_info.address,
                     force_update=False,
                     save_data=True,
                 )
-            if self._data is None or len(self._data) == 0:
-                self._manager.get_login_from_cache()
-            if self._data is not None and len(self._data) > 0:
+            if not self._data:
+                manager.get_login_from_cache()
+            if self._data:
                 user_input.update(self._data)
         return _show_login_form(self, user_input, errors, placeholders)
 
@@ -306,9 +343,7 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
         )
 
         errors: dict[str, str] = {}
-        if self._manager is None:
-            msg = "Device manager is not initialized"
-            raise RuntimeError(msg)
+        manager = self._get_manager()
 
         if device_selected_user_input is not None:
             _LOGGER.debug(
@@ -316,12 +351,12 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
             )
             address = device_selected_user_input[CONF_ADDRESS]
             discovery_info = self._discovered_devices[address]
-            local_name = await get_device_readable_name(discovery_info, self._manager)
+            local_name = await self._get_readable_name(discovery_info)
             await self.async_set_unique_id(
                 discovery_info.address, raise_on_progress=False
             )
             self._abort_if_unique_id_configured()
-            credentials = await self._manager.get_device_credentials(
+            credentials = await manager.get_device_credentials(
                 discovery_info.address,
                 force_update=self._get_device_info_error,
                 save_data=True,
@@ -339,14 +374,16 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if discovery := self._discovery_info:
             self._discovered_devices[discovery.address] = discovery
-        else:
-            current_addresses = self._async_current_ids()
+        elif not self._discovery_scanned:
+            # Scan once per flow; re-renders after errors reuse the result.
+            self._discovery_scanned = True
+            skip_addresses = self._async_current_ids() | self._discovered_devices.keys()
+            service_uuid = SERVICE_UUID
             for discovery in async_discovered_service_info(self.hass):
                 if (
-                    discovery.address in current_addresses
-                    or discovery.address in self._discovered_devices
+                    discovery.address in skip_addresses
                     or discovery.service_data is None
-                    or SERVICE_UUID not in discovery.service_data
+                    or service_uuid not in discovery.service_data
                 ):
                     continue
                 self._discovered_devices[discovery.address] = discovery
@@ -363,12 +400,16 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
         else:
             def_address = next(iter(self._discovered_devices))
 
+        service_infos = list(self._discovered_devices.values())
+        names = await asyncio.gather(
+            *(self._get_readable_name(service_info) for service_info in service_infos)
+        )
+        readable_names = {
+            service_info.address: name
+            for service_info, name in zip(service_infos, names, strict=True)
+        }
         _LOGGER.debug(
-            "Discovered devices: %s\nWaiting for user input...",
-            {
-                addr: await get_device_readable_name(info, self._manager)
-                for addr, info in self._discovered_devices.items()
-            },
+            "Discovered devices: %s\nWaiting for user input...", readable_names
         )
         return self.async_show_form(
             step_id="device",
@@ -377,15 +418,7 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
                     vol.Required(
                         CONF_ADDRESS,
                         default=def_address,
-                    ): vol.In(
-                        {
-                            service_info.address: await get_device_readable_name(
-                                service_info,
-                                self._manager,
-                            )
-                            for service_info in self._discovered_devices.values()
-                        }
-                    ),
+                    ): vol.In(readable_names),
                 },
             ),
             errors=errors,
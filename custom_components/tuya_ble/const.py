@@ -13,7 +13,11 @@ TUYA_DOMAIN: Final = "tuya"
 DEVICE_METADATA_UUIDS: Final = "uuids"
 
 DEVICE_DEF_MANUFACTURER: Final = "Tuya"
-SET_DISCONNECTED_DELAY = 10 * 60
+# Grace period before a device is marked unavailable; the timer is reset
+# on every reconnect, so a short window keeps availability fresh without
+# flapping during brief connection drops.
+SET_DISCONNECTED_DELAY = 20.0
+DATAPOINT_WRITE_COALESCE_DELAY = 0.05
 
 CONF_UUID: Final = "uuid"
 CONF_LOCAL_KEY: Final = "local_key"
@@ -11,6 +11,7 @@ from homeassistant.components.cover import (
     CoverDeviceClass,
     CoverEntity,
     CoverEntityDescription,
+    CoverEntityFeature,
 )
 from homeassistant.core import callback
 from homeassistant.helpers.event import async_call_later
@@ -34,8 +35,22 @@ TuyaBLECoverIsAvailable = Callable[["TuyaBLECover", TuyaBLEProductInfo], bool] |
 _MOTION_SETTLE_DELAY = 1.5
 _CONTROL_ECHO_TIMEOUT = 4.0
 
+# Values of the control enum datapoint.
+_CONTROL_OPEN = 0
+_CONTROL_STOP = 1
+_CONTROL_CLOSE = 2
 
-@dataclass
+# The device reports position inverted relative to Home Assistant:
+# raw 0 is fully open, raw 100 is fully closed.
+_RAW_FULLY_CLOSED = 100
+
+# Hoisted so the command/read paths load these as globals of this module
+# instead of attribute lookups on the enum class.
+_DT_ENUM = TuyaBLEDataPointType.DT_ENUM
+_DT_VALUE = TuyaBLEDataPointType.DT_VALUE
+
+
+@dataclass(frozen=True, slots=True)
 class TuyaBLECoverMapping:
     """
     Mapping configuration for a Tuya BLE cover entity.
@@ -75,7 +90,7 @@ class TuyaBLECoverMapping:
     control_echo_timeout: float | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLECategoryCoverMapping:
     """
     Category-level mapping configuration for Tuya BLE cover entities.
@@ -127,6 +142,24 @@ mapping: dict[str, TuyaBLECategoryCoverMapping] = {
 }
 
 
+# Flattened lookup tables built once at import time so resolving a device's
+# mappings is a single hash probe instead of a nested dict walk.
+_EMPTY: list[TuyaBLECoverMapping] = []
+
+_PRODUCT_INDEX: dict[tuple[str, str], list[TuyaBLECoverMapping]] = {
+    (category_id, product_id): product_mapping
+    for category_id, category in mapping.items()
+    if category.products is not None
+    for product_id, product_mapping in category.products.items()
+}
+
+_CATEGORY_FALLBACK: dict[str, list[TuyaBLECoverMapping]] = {
+    category_id: category.mapping
+    for category_id, category in mapping.items()
+    if category.mapping is not None
+}
+
+
 def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLECoverMapping]:
     """
     Get cover mappings for a Tuya BLE device.
@@ -142,20 +175,32 @@ def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLECoverMapping]:
         List of cover mappings for the device, or empty list if none found.
 
     """
-    category = mapping.get(device.category)
-    if category is not None and category.products is not None:
-        product_mapping = category.products.get(device.product_id)
-        if product_mapping is not None:
-            return product_mapping
-        if category.mapping is not None:
-            return category.mapping
-        return []
-    return []
+    return _PRODUCT_INDEX.get(
+        (device.category, device.product_id)
+    ) or _CATEGORY_FALLBACK.get(device.category, _EMPTY)
 
 
 class TuyaBLECover(TuyaBLEEntity, CoverEntity):
     """Representation of a Tuya BLE Cover."""
 
+    # The entity base classes are not slotted, so instances keep a
+    # __dict__, but the attributes declared here still get fixed-offset
+    # access on the per-update hot paths.
+    __slots__ = (
+        "_cached_position",
+        "_cached_raw_position",
+        "_clear_control_echo_unsub",
+        "_clear_motion_unsub",
+        "_control_dp_id",
+        "_dp_id",
+        "_dp_type",
+        "_last_raw_position",
+        "_last_written_state",
+        "_mapping",
+        "_movement_direction",
+        "_position_dp_id",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -167,7 +212,27 @@ class TuyaBLECover(TuyaBLEEntity, CoverEntity):
         """Initialize a Tuya BLE cover entity."""
         super().__init__(hass, coordinator, device, product, mapping.description)
         self._mapping = mapping
+        # Pre-bind the frequently used datapoint IDs; the mapping is
+        # immutable, so this trades attribute chains for direct loads on
+        # the per-update and per-command paths.
+        self._dp_id = mapping.dp_id
+        self._dp_type = mapping.dp_type or _DT_VALUE
+        self._control_dp_id = mapping.control_dp_id
+        self._position_dp_id = mapping.position_dp_id
+        features = CoverEntityFeature(0)
+        if mapping.control_dp_id:
+            features |= (
+                CoverEntityFeature.OPEN
+                | CoverEntityFeature.CLOSE
+                | CoverEntityFeature.STOP
+            )
+        if mapping.position_dp_id:
+            features |= CoverEntityFeature.SET_POSITION
+        self._attr_supported_features = features
         self._last_raw_position = self._get_raw_position()
+        self._cached_raw_position: int | None = None
+        self._cached_position: int | None = None
+        self._last_written_state: tuple[int | None, int, bool] | None = None
         self._movement_direction = 0
         self._clear_motion_unsub = None
         self._clear_control_echo_unsub = None
@@ -180,12 +245,15 @@ class TuyaBLECover(TuyaBLEEntity, CoverEntity):
 
     def _get_raw_position(self) -> int | None:
         """Return raw device position without Home Assistant inversion."""
-        datapoint = self._device.datapoints.get_or_create(
-            self._mapping.dp_id,
-            self._mapping.dp_type or TuyaBLEDataPointType.DT_VALUE,
-            0,
-        )
-        if datapoint and datapoint.value is not None:
+        # Fast path: after the first report the datapoint already exists.
+        datapoint = self._device.datapoints[self._dp_id]
+        if datapoint is None:
+            datapoint = self._device.datapoints.get_or_create(
+                self._dp_id,
+                self._dp_type,
+                0,
+            )
+        if datapoint.value is not None:
             return int(datapoint.value)
         return None
 
@@ -254,19 +322,22 @@ class TuyaBLECover(TuyaBLEEntity, CoverEntity):
     def current_cover_position(self) -> int | None:
         """Return current position of cover."""
         raw_position = self._get_raw_position()
-        if raw_position is not None:
+        if raw_position is None:
+            return None
+        if raw_position != self._cached_raw_position:
             # Device uses inverted position: 0=open, 100=closed
             # Home Assistant standard: 0=closed, 100=open
-            return 100 - raw_position
-        return None
+            self._cached_raw_position = raw_position
+            self._cached_position = 100 - raw_position
+        return self._cached_position
 
     @property
     def is_closed(self) -> bool | None:
         """Return if cover is closed."""
-        position = self.current_cover_position
-        if position is None:
+        raw_position = self._get_raw_position()
+        if raw_position is None:
             return None
-        return position == 0
+        return raw_position == _RAW_FULLY_CLOSED
 
     @property
     def is_opening(self) -> bool:
@@ -278,48 +349,36 @@ class TuyaBLECover(TuyaBLEEntity, CoverEntity):
         """Return if cover is closing."""
         return self._movement_direction < 0
 
-    def open_cover(self, **_kwargs: Any) -> None:
+    @callback
+    def _send_control(self, value: int, direction: int) -> None:
+        """Queue a control enum value and start motion/echo bookkeeping."""
+        if self._control_dp_id:
+            self._set_motion_state(direction)
+            self._arm_control_echo_watchdog()
+            datapoint = self._device.datapoints[self._control_dp_id]
+            if datapoint is None:
+                datapoint = self._device.datapoints.get_or_create(
+                    self._control_dp_id,
+                    _DT_ENUM,
+                    value,
+                )
+            self._coordinator.queue_datapoint_write(datapoint, value)
+
+    async def async_open_cover(self, **_kwargs: Any) -> None:
         """Open the cover."""
-        if self._mapping.control_dp_id:
-            self._hass.add_job(self._set_motion_state, 1)
-            self._hass.add_job(self._arm_control_echo_watchdog)
-            datapoint = self._device.datapoints.get_or_create(
-                self._mapping.control_dp_id,
-                TuyaBLEDataPointType.DT_ENUM,
-                0,
-            )
-            if datapoint:
-                self._hass.create_task(datapoint.set_value(0))
+        self._send_control(_CONTROL_OPEN, 1)
 
-    def close_cover(self, **_kwargs: Any) -> None:
+    async def async_close_cover(self, **_kwargs: Any) -> None:
         """Close the cover."""
-        if self._mapping.control_dp_id:
-            self._hass.add_job(self._set_motion_state, -1)
-            self._hass.add_job(self._arm_control_echo_watchdog)
-            datapoint = self._device.datapoints.get_or_create(
-                self._mapping.control_dp_id,
-                TuyaBLEDataPointType.DT_ENUM,
-                2,
-            )
-            if datapoint:
-                self._hass.create_task(datapoint.set_value(2))
+        self._send_control(_CONTROL_CLOSE, -1)
 
-    def stop_cover(self, **_kwargs: Any) -> None:
+    async def async_stop_cover(self, **_kwargs: Any) -> None:
         """Stop the cover."""
-        if self._mapping.control_dp_id:
-            self._hass.add_job(self._set_motion_state, 0)
-            self._hass.add_job(self._arm_control_echo_watchdog)
-            datapoint = self._device.datapoints.get_or_create(
-                self._mapping.control_dp_id,
-                TuyaBLEDataPointType.DT_ENUM,
-                1,
-            )
-            if datapoint:
-                self._hass.create_task(datapoint.set_value(1))
+        self._send_control(_CONTROL_STOP, 0)
 
-    def set_cover_position(self, **kwargs: Any) -> None:
+    async def async_set_cover_position(self, **kwargs: Any) -> None:
         """Set cover position."""
-        if ATTR_POSITION in kwargs and self._mapping.position_dp_id:
+        if ATTR_POSITION in kwargs and self._position_dp_id:
             position = kwargs[ATTR_POSITION]
             # Device uses inverted position, so invert the value
             inverted_position = 100 - int(position)
@@ -328,17 +387,17 @@ class TuyaBLECover(TuyaBLEEntity, CoverEntity):
                 current_raw_position is not None
                 and inverted_position != current_raw_position
             ):
-                self._hass.add_job(
-                    self._set_motion_state,
+                self._set_motion_state(
                     1 if inverted_position < current_raw_position else -1,
                 )
-            datapoint = self._device.datapoints.get_or_create(
-                self._mapping.position_dp_id,
-                TuyaBLEDataPointType.DT_VALUE,
-                0,
-            )
-            if datapoint:
-                self._hass.create_task(datapoint.set_value(inverted_position))
+            datapoint = self._device.datapoints[self._position_dp_id]
+            if datapoint is None:
+                datapoint = self._device.datapoints.get_or_create(
+                    self._position_dp_id,
+                    _DT_VALUE,
+                    0,
+                )
+            self._coordinator.queue_datapoint_write(datapoint, inverted_position)
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -351,7 +410,11 @@ class TuyaBLECover(TuyaBLEEntity, CoverEntity):
         ):
             self._set_motion_state(1 if raw_position < self._last_raw_position else -1)
         self._last_raw_position = raw_position
-        super()._handle_coordinator_update()
+        # Skip the state write when nothing visible to Home Assistant changed.
+        state = (raw_position, self._movement_direction, self.available)
+        if state != self._last_written_state:
+            self._last_written_state = state
+            super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
@@ -361,22 +424,6 @@ class TuyaBLECover(TuyaBLEEntity, CoverEntity):
             result = self._mapping.is_available(self, self._product)
         return result
 
-    @property
-    def supported_features(self) -> int:
-        """Return the supported features."""
-        features = 0
-        # Support opening/closing via commands
-        if self._mapping.control_dp_id:
-            features |= (
-                0x1  # OPEN
-                | 0x2  # CLOSE
-                | 0x4  # STOP
-            )
-        # Support position setting
-        if self._mapping.position_dp_id:
-            features |= 0x8  # SET_POSITION
-        return features
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -386,7 +433,11 @@ async def async_setup_entry(
     """Set up the Tuya BLE covers."""
     data: TuyaBLEData = hass.data[DOMAIN][entry.entry_id]
     mappings = get_mapping_by_device(data.device)
+    if not mappings:
+        # Most Tuya BLE devices are not covers; skip the entity build.
+        return
 
+    datapoints = data.device.datapoints
     entities: list[TuyaBLECover] = [
         TuyaBLECover(
             hass,
@@ -396,7 +447,6 @@ async def async_setup_entry(
             mapping,
         )
         for mapping in mappings
-        if mapping.force_add
-        or data.device.datapoints.has_id(mapping.dp_id, mapping.dp_type)
+        if mapping.force_add or datapoints.has_id(mapping.dp_id, mapping.dp_type)
     ]
     async_add_entities(entities)
@@ -8,7 +8,9 @@ registry integration.
 
 from __future__ import annotations
 
+import functools
 import logging
+import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -28,6 +30,7 @@ from homeassistant.helpers.entity import (
 from homeassistant.helpers.event import async_call_later
 
 from .const import (
+    DATAPOINT_WRITE_COALESCE_DELAY,
     DEVICE_DEF_MANUFACTURER,
     DOMAIN,
     FINGERBOT_BUTTON_EVENT,
@@ -35,6 +38,7 @@ from .const import (
 )
 
 if TYPE_CHECKING:
+    import asyncio
     import datetime
 
     from home_assistant_bluetooth import BluetoothServiceInfoBleak
@@ -49,8 +53,16 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Some fingerbots emit a burst of duplicate switch datapoints for one
+# physical press; collapse them into a single bus event.
+_BUTTON_EVENT_DEBOUNCE = 0.1
 
-@dataclass
+# Versions only change on a firmware update, so throttle the registry
+# version check to once a minute on chatty reconnects.
+_REGISTRY_UPDATE_INTERVAL = 60.0
+
+
+@dataclass(frozen=True, slots=True)
 class TuyaBLEFingerbotInfo:
     """
     Fingerbot device configuration information.
@@ -86,7 +98,7 @@ class TuyaBLEFingerbotInfo:
     program: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLELockInfo:
     """
     Lock device configuration information.
@@ -110,7 +122,7 @@ class TuyaBLELockInfo:
     unlock_password: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLEProductInfo:
     """
     Product information for Tuya BLE devices.
@@ -177,14 +189,20 @@ class TuyaBLEEntity(PassiveBluetoothCoordinatorEntity):
         self.entity_description = description
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{self._device.device_id}-{description.key}"
+        self._attr_device_info = get_device_info(device)
         self.entity_id = generate_entity_id(
             "sensor.{}", self._attr_unique_id, hass=hass
         )
 
-    @property
-    def device_info(self) -> DeviceInfo | None:
-        """Return device info."""
-        return get_device_info(self._device)
+    async def async_added_to_hass(self) -> None:
+        """Register for direct push updates from the coordinator."""
+        await super().async_added_to_hass()
+        self._coordinator.register_entity(self)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister from direct push updates."""
+        self._coordinator.unregister_entity(self)
+        await super().async_will_remove_from_hass()
 
     @property
     def available(self) -> bool:
@@ -205,6 +223,10 @@ class TuyaBLEPassiveCoordinator(PassiveBluetoothDataUpdateCoordinator):
     and event firing for Tuya BLE devices.
     """
 
+    # Class attribute so product-specific subclasses can tune the
+    # disconnect grace period.
+    set_disconnected_delay: float = SET_DISCONNECTED_DELAY
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -231,9 +253,32 @@ class TuyaBLEPassiveCoordinator(PassiveBluetoothDataUpdateCoordinator):
             hass, logger, address, BluetoothScanningMode.ACTIVE, connectable=True
         )
         self._device = device
+        self._device_registry = dr.async_get(hass)
         self._disconnected: bool = True
-        self._unsub_disconnect: CALLBACK_TYPE | None = None
+        self._unsub_disconnect: asyncio.TimerHandle | None = None
         self._unsub_refresh_requests: list[CALLBACK_TYPE] = []
+        self._pending_dp_writes: dict[
+            int, tuple[TuyaBLEDataPoint, bytes | bool | int | str]
+        ] = {}
+        self._flush_dp_writes_handle: asyncio.TimerHandle | None = None
+        # The product never changes for a paired device; resolve it once so
+        # the per-update handler does not repeat the database lookup.
+        self._product_info = get_device_product_info(device)
+        info = self._product_info
+        self._fingerbot_switch_id = (
+            info.fingerbot.switch
+            if info and info.fingerbot and info.fingerbot.manual_control != 0
+            else 0
+        )
+        self._lock_info = info.lock if info else None
+        self._last_button_fire: float = 0.0
+        self._last_registry_update: float = 0.0
+        # Address and device id never change; build the payload once.
+        self._button_event_payload = {
+            CONF_ADDRESS: device.address,
+            CONF_DEVICE_ID: device.device_id,
+        }
+        self._entities: list[TuyaBLEEntity] = []
         device.register_connected_callback(self._async_handle_connect)
         device.register_callback(self._async_handle_update)
         device.register_disconnected_callback(self._async_handle_disconnect)
@@ -243,42 +288,96 @@ class TuyaBLEPassiveCoordinator(PassiveBluetoothDataUpdateCoordinator):
         """Return True if the device is currently connected."""
         return not self._disconnected
 
+    @callback
+    def register_entity(self, entity: TuyaBLEEntity) -> None:
+        """Register an entity for direct push updates."""
+        self._entities.append(entity)
+
+    @callback
+    def unregister_entity(self, entity: TuyaBLEEntity) -> None:
+        """Unregister an entity from direct push updates."""
+        if entity in self._entities:
+            self._entities.remove(entity)
+
+    @callback
+    def queue_datapoint_write(
+        self,
+        datapoint: TuyaBLEDataPoint,
+        value: bytes | bool | int | str,  # noqa: FBT001
+    ) -> None:
+        """
+        Queue a datapoint write, coalescing rapid successive writes.
+
+        Writes issued within the coalescing window are flushed together,
+        and a later write to the same datapoint replaces its queued value,
+        so rapid command sequences cost a single BLE round-trip.
+        """
+        self._pending_dp_writes[datapoint.id] = (datapoint, value)
+        if self._flush_dp_writes_handle is None:
+            self._flush_dp_writes_handle = self.hass.loop.call_later(
+                DATAPOINT_WRITE_COALESCE_DELAY,
+                self._flush_datapoint_writes,
+            )
+
+    @callback
+    def _flush_datapoint_writes(self) -> None:
+        """Send all queued datapoint writes."""
+        self._flush_dp_writes_handle = None
+        pending = list(self._pending_dp_writes.values())
+        self._pending_dp_writes.clear()
+        for datapoint, value in pending:
+            self.hass.async_create_task(datapoint.set_value(value))
+
     @callback
     def _async_update_device_registry_versions(self) -> None:
         """Update device registry with latest firmware/protocol/hardware versions."""
+        device = self._device
         if not (
-            self._device.device_version
-            or self._device.protocol_version
-            or self._device.hardware_version
+            device.device_version or device.protocol_version or device.hardware_version
         ):
             return
 
-        device_registry = dr.async_get(self.hass)
-        device_entry = device_registry.async_get_device(
-            identifiers={(DOMAIN, self._device.address)}
+        now = self.hass.loop.time()
+        if now - self._last_registry_update < _REGISTRY_UPDATE_INTERVAL:
+            return
+        self._last_registry_update = now
+
+        device_entry = self._device_registry.async_get_device(
+            identifiers={(DOMAIN, device.address)}
         )
         if device_entry is None:
             return
 
-        device_registry.async_update_device(
+        hw_version = device.hardware_version or None
+        sw_version = (
+            f"{device.device_version} (protocol {device.protocol_version})"
+            if device.device_version or device.protocol_version
+            else None
+        )
+        # Reconnects rarely change versions; skip the registry write (and
+        # the dispatcher/storage churn it causes) when nothing changed.
+        if (
+            device_entry.hw_version == hw_version
+            and device_entry.sw_version == sw_version
+        ):
+            return
+
+        self._device_registry.async_update_device(
             device_entry.id,
-            hw_version=self._device.hardware_version or None,
-            sw_version=(
-                f"{self._device.device_version} "
-                f"(protocol {self._device.protocol_version})"
-                if self._device.device_version or self._device.protocol_version
-                else None
-            ),
+            hw_version=hw_version,
+            sw_version=sw_version,
         )
 
     @callback
     def _async_handle_connect(self) -> None:
         if self._unsub_disconnect is not None:
-            self._unsub_disconnect()
+            self._unsub_disconnect.cancel()
+            self._unsub_disconnect = None
         if self._disconnected:
             self._disconnected = False
             self._schedule_refresh_requests()
-            self.async_update_listeners()
+            if self._listeners:
+                self.async_update_listeners()
         self._async_update_device_registry_versions()
 
     @callback
@@ -303,24 +402,42 @@ class TuyaBLEPassiveCoordinator(PassiveBluetoothDataUpdateCoordinator):
 
     @callback
     def _async_handle_update(self, updates: list[TuyaBLEDataPoint]) -> None:
-        self._async_handle_connect()
-        self.async_update_listeners()
+        # Skip the reconnect bookkeeping when already marked connected.
+        if self._disconnected or self._unsub_disconnect is not None:
+            self._async_handle_connect()
+        # Push the update straight to our entities; this skips the
+        # DataUpdateCoordinator listener/HassJob machinery per datapoint
+        # burst while keeping each entity's own update handler in play.
+        for entity in self._entities:
+            entity._handle_coordinator_update()  # noqa: SLF001
         self._async_update_device_registry_versions()
-        info = get_device_product_info(self._device)
-        if info and info.fingerbot and info.fingerbot.manual_control != 0:
-            for update in updates:
-                if update.id == info.fingerbot.switch and update.changed_by_device:
-                    self.hass.bus.fire(
-                        FINGERBOT_BUTTON_EVENT,
-                        {
-                            CONF_ADDRESS: self._device.address,
-                            CONF_DEVICE_ID: self._device.device_id,
-                        },
-                    )
-        if info and info.lock:
+        if self._fingerbot_switch_id:
+            self._fire_fingerbot_events(updates)
+        if self._lock_info is not None:
+            self._fire_lock_events(updates)
+
+    @callback
+    def _fire_fingerbot_events(self, updates: list[TuyaBLEDataPoint]) -> None:
+        """Fire debounced button events for fingerbot switch updates."""
+        for update in updates:
+            if update.id == self._fingerbot_switch_id and update.changed_by_device:
+                now = self.hass.loop.time()
+                if now - self._last_button_fire < _BUTTON_EVENT_DEBOUNCE:
+                    continue
+                self._last_button_fire = now
+                self.hass.bus.fire(
+                    FINGERBOT_BUTTON_EVENT,
+                    self._button_event_payload,
+                )
+
+    @callback
+    def _fire_lock_events(self, updates: list[TuyaBLEDataPoint]) -> None:
+        """Fire lock alarm/unlock events for device-initiated updates."""
+        lock = self._lock_info
+        if lock is not None:
             for update in updates:
                 if update.changed_by_device:
-                    if update.id == info.lock.alarm_lock:
+                    if update.id == lock.alarm_lock:
                         self.hass.bus.fire(
                             f"{DOMAIN}_lock_alarm_event",
                             {
@@ -330,7 +447,7 @@ class TuyaBLEPassiveCoordinator(PassiveBluetoothDataUpdateCoordinator):
                                 "value": update.value,
                             },
                         )
-                    elif update.id == info.lock.unlock_ble:
+                    elif update.id == lock.unlock_ble:
                         self.hass.bus.fire(
                             f"{DOMAIN}_lock_unlock_ble_event",
                             {
@@ -340,7 +457,7 @@ class TuyaBLEPassiveCoordinator(PassiveBluetoothDataUpdateCoordinator):
                                 "value": update.value,
                             },
                         )
-                    elif update.id == info.lock.unlock_fingerprint:
+                    elif update.id == lock.unlock_fingerprint:
                         self.hass.bus.fire(
                             f"{DOMAIN}_lock_unlock_fingerprint_event",
                             {
@@ -350,7 +467,7 @@ class TuyaBLEPassiveCoordinator(PassiveBluetoothDataUpdateCoordinator):
                                 "value": update.value,
                             },
                         )
-                    elif update.id == info.lock.unlock_password:
+                    elif update.id == lock.unlock_password:
                         self.hass.bus.fire(
                             f"{DOMAIN}_lock_unlock_password_event",
                             {
@@ -362,22 +479,24 @@ class TuyaBLEPassiveCoordinator(PassiveBluetoothDataUpdateCoordinator):
                         )
 
     @callback
-    def _set_disconnected(self, _: datetime.datetime) -> None:
+    def _set_disconnected(self) -> None:
         self._disconnected = True
         self._unsub_disconnect = None
         self._cancel_refresh_requests()
-        self.async_update_listeners()
+        if self._listeners:
+            self.async_update_listeners()
 
     @callback
     def _async_handle_disconnect(self) -> None:
         if self._unsub_disconnect is None:
-            delay: float = SET_DISCONNECTED_DELAY
-            self._unsub_disconnect = async_call_later(
-                self.hass, delay, self._set_disconnected
+            # Schedule on the loop directly; this skips the HassJob wrapper
+            # async_call_later would allocate on every disconnect edge.
+            self._unsub_disconnect = self.hass.loop.call_later(
+                self.set_disconnected_delay, self._set_disconnected
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class TuyaBLEData:
     """
     Data for the Tuya BLE integration.
@@ -404,194 +523,132 @@ class TuyaBLEData:
     coordinator: TuyaBLEPassiveCoordinator
 
 
-@dataclass
-class TuyaBLECategoryInfo:
-    """
-    Category information for Tuya BLE devices.
-
-    Attributes
-    ----------
-    products : dict[str, TuyaBLEProductInfo]
-        Mapping of product IDs to product information.
-    info : TuyaBLEProductInfo | None
-        Default product information for the category. Defaults to None.
-
-    """
-
-    products: dict[str, TuyaBLEProductInfo]
-    info: TuyaBLEProductInfo | None = None
-
-
-devices_database: dict[str, TuyaBLECategoryInfo] = {
-    "cl": TuyaBLECategoryInfo(
-        products={
-            "kcy0x4pi": TuyaBLEProductInfo(  # Smart curtain robot 4
-                name="Smart Curtain Robot",
-            ),
-            "ousymtkt": TuyaBLEProductInfo(  # Roller Blind Robot
-                name="Roller Blind Robot",
-            ),
-        },
+# Shared product variants, interned so every product ID referencing the
+# same hardware points at one canonical instance.
+_FINGERBOT_PLUS_SZJQR = TuyaBLEProductInfo(
+    name="Fingerbot Plus",
+    fingerbot=TuyaBLEFingerbotInfo(
+        switch=2,
+        mode=8,
+        up_position=15,
+        down_position=9,
+        hold_time=10,
+        reverse_positions=11,
+        manual_control=17,
+        program=121,
     ),
-    "co2bj": TuyaBLECategoryInfo(
-        products={
-            "59s19z5m": TuyaBLEProductInfo(  # device product_id
-                name="CO2 Detector",
-            ),
-        },
-    ),
-    "ms": TuyaBLECategoryInfo(
-        products={
-            **dict.fromkeys(
-                ["ludzroix", "isk2p555"],
-                TuyaBLEProductInfo(  # device product_id
-                    name="Smart Lock",
-                ),
-            ),
-        },
-    ),
-    "jtmspro": TuyaBLECategoryInfo(
-        products={
-            "ebd5e0uauqx0vfsp": TuyaBLEProductInfo(  # device product_id
-                name="CentralAcesso",
-            ),
-        },
+)
+
+_FINGERBOT_SZJQR = TuyaBLEProductInfo(
+    name="Fingerbot",
+    fingerbot=TuyaBLEFingerbotInfo(
+        switch=2,
+        mode=8,
+        up_position=15,
+        down_position=9,
+        hold_time=10,
+        reverse_positions=11,
+        program=121,
     ),
-    "szjqr": TuyaBLECategoryInfo(
-        products={
-            "3yqdo5yt": TuyaBLEProductInfo(  # device product_id
-                name="CUBETOUCH 1s",
-                fingerbot=TuyaBLEFingerbotInfo(
-                    switch=1,
-                    mode=2,
-                    up_position=5,
-                    down_position=6,
-                    hold_time=3,
-                    reverse_positions=4,
-                ),
-            ),
-            "xhf790if": TuyaBLEProductInfo(  # device product_id
-                name="CubeTouch II",
-                fingerbot=TuyaBLEFingerbotInfo(
-                    switch=1,
-                    mode=2,
-                    up_position=5,
-                    down_position=6,
-                    hold_time=3,
-                    reverse_positions=4,
-                ),
-            ),
-            **dict.fromkeys(
-                ["blliqpsj", "ndvkgsrm", "yiihr7zh", "neq16kgd"],  # device product_ids
-                TuyaBLEProductInfo(
-                    name="Fingerbot Plus",
-                    fingerbot=TuyaBLEFingerbotInfo(
-                        switch=2,
-                        mode=8,
-                        up_position=15,
-                        down_position=9,
-                        hold_time=10,
-                        reverse_positions=11,
-                        manual_control=17,
-                        program=121,
-                    ),
-                ),
-            ),
-            **dict.fromkeys(
-                [
-                    "ltak7e1p",
-                    "y6kttvd6",
-                    "yrnk7mnn",
-                    "nvr2rocq",
-                    "bnt7wajf",
-                    "rvdceqjh",
-                    "5xhbk964",
-                ],  # device product_ids
-                TuyaBLEProductInfo(
-                    name="Fingerbot",
-                    fingerbot=TuyaBLEFingerbotInfo(
-                        switch=2,
-                        mode=8,
-                        up_position=15,
-                        down_position=9,
-                        hold_time=10,
-                        reverse_positions=11,
-                        program=121,
-                    ),
-                ),
-            ),
-        },
+)
+
+_FINGERBOT_PLUS_KG = TuyaBLEProductInfo(
+    name="Fingerbot Plus",
+    fingerbot=TuyaBLEFingerbotInfo(
+        switch=1,
+        mode=101,
+        up_position=106,
+        down_position=102,
+        hold_time=103,
+        reverse_positions=104,
+        manual_control=107,
+        program=109,
     ),
-    "kg": TuyaBLECategoryInfo(
-        products={
-            **dict.fromkeys(
-                ["mknd4lci", "riecov42"],  # device product_ids
-                TuyaBLEProductInfo(
-                    name="Fingerbot Plus",
-                    fingerbot=TuyaBLEFingerbotInfo(
-                        switch=1,
-                        mode=101,
-                        up_position=106,
-                        down_position=102,
-                        hold_time=103,
-                        reverse_positions=104,
-                        manual_control=107,
-                        program=109,
-                    ),
-                ),
+)
+
+# Compact device table: (category, product IDs, product info). Rows are
+# cheap tuples at import; the flat lookup dict is expanded lazily on the
+# first product query.
+_DEVICE_TABLE: tuple[tuple[str, tuple[str, ...], TuyaBLEProductInfo], ...] = (
+    ("cl", ("kcy0x4pi",), TuyaBLEProductInfo(name="Smart Curtain Robot")),
+    ("cl", ("ousymtkt",), TuyaBLEProductInfo(name="Roller Blind Robot")),
+    ("co2bj", ("59s19z5m",), TuyaBLEProductInfo(name="CO2 Detector")),
+    ("ms", ("ludzroix", "isk2p555"), TuyaBLEProductInfo(name="Smart Lock")),
+    ("jtmspro", ("ebd5e0uauqx0vfsp",), TuyaBLEProductInfo(name="CentralAcesso")),
+    (
+        "szjqr",
+        ("3yqdo5yt",),
+        TuyaBLEProductInfo(
+            name="CUBETOUCH 1s",
+            fingerbot=TuyaBLEFingerbotInfo(
+                switch=1,
+                mode=2,
+                up_position=5,
+                down_position=6,
+                hold_time=3,
+                reverse_positions=4,
             ),
-        },
+        ),
     ),
-    "wk": TuyaBLECategoryInfo(
-        products={
-            **dict.fromkeys(
-                [
-                    "drlajpqc",
-                    "nhj2j7su",
-                ],  # device product_id
-                TuyaBLEProductInfo(
-                    name="Thermostatic Radiator Valve",
-                ),
+    (
+        "szjqr",
+        ("xhf790if",),
+        TuyaBLEProductInfo(
+            name="CubeTouch II",
+            fingerbot=TuyaBLEFingerbotInfo(
+                switch=1,
+                mode=2,
+                up_position=5,
+                down_position=6,
+                hold_time=3,
+                reverse_positions=4,
             ),
-        },
+        ),
     ),
-    "wsdcg": TuyaBLECategoryInfo(
-        products={
-            "ojzlzzsw": TuyaBLEProductInfo(  # device product_id
-                name="Soil moisture sensor",
-            ),
-        },
+    (
+        "szjqr",
+        ("blliqpsj", "ndvkgsrm", "yiihr7zh", "neq16kgd"),
+        _FINGERBOT_PLUS_SZJQR,
     ),
-    "znhsb": TuyaBLECategoryInfo(
-        products={
-            "cdlandip":  # device product_id
-            TuyaBLEProductInfo(
-                name="Smart water bottle",
-            ),
-        },
+    (
+        "szjqr",
+        (
+            "ltak7e1p",
+            "y6kttvd6",
+            "yrnk7mnn",
+            "nvr2rocq",
+            "bnt7wajf",
+            "rvdceqjh",
+            "5xhbk964",
+        ),
+        _FINGERBOT_SZJQR,
     ),
-    "sfkzq": TuyaBLECategoryInfo(
-        products={
-            "nxquc5lb": TuyaBLEProductInfo(
-                name="Water valve controller",
-            ),
-        },
+    ("kg", ("mknd4lci", "riecov42"), _FINGERBOT_PLUS_KG),
+    (
+        "wk",
+        ("drlajpqc", "nhj2j7su"),
+        TuyaBLEProductInfo(name="Thermostatic Radiator Valve"),
     ),
-    "ggq": TuyaBLECategoryInfo(
-        products={
-            **dict.fromkeys(
-                [
-                    "6pahkcau",
-                    "hfgdqhho",
-                    "fnlw6npo",
-                ],  # device product_id
-                TuyaBLEProductInfo(
-                    name="Irrigation computer",
-                ),
-            ),
-        },
+    ("wsdcg", ("ojzlzzsw",), TuyaBLEProductInfo(name="Soil moisture sensor")),
+    ("znhsb", ("cdlandip",), TuyaBLEProductInfo(name="Smart water bottle")),
+    ("sfkzq", ("nxquc5lb",), TuyaBLEProductInfo(name="Water valve controller")),
+    (
+        "ggq",
+        ("6pahkcau", "hfgdqhho", "fnlw6npo"),
+        TuyaBLEProductInfo(name="Irrigation computer"),
     ),
-}
+)
+
+_product_lookup: dict[tuple[str, str], TuyaBLEProductInfo] = {}
+
+
+def _ensure_product_lookup() -> dict[tuple[str, str], TuyaBLEProductInfo]:
+    """Expand the device table into the flat lookup on first use."""
+    if not _product_lookup:
+        for category, product_ids, product_info in _DEVICE_TABLE:
+            for product_id in product_ids:
+                _product_lookup[(category, product_id)] = product_info
+    return _product_lookup
 
 
 def get_product_info_by_ids(
@@ -610,16 +667,10 @@ def get_product_info_by_ids(
     Returns
     -------
     TuyaBLEProductInfo | None
-        Product information if found, otherwise category default info or None.
+        Product information if found, otherwise None.
 
     """
-    category_info = devices_database.get(category)
-    if category_info is not None:
-        product_info = category_info.products.get(product_id)
-        if product_info is not None:
-            return product_info
-        return category_info.info
-    return None
+    return _ensure_product_lookup().get((category, product_id))
 
 
 def get_device_product_info(device: TuyaBLEDevice) -> TuyaBLEProductInfo | None:
@@ -640,6 +691,7 @@ def get_device_product_info(device: TuyaBLEDevice) -> TuyaBLEProductInfo | None:
     return get_product_info_by_ids(device.category, device.product_id)
 
 
+@functools.lru_cache(maxsize=512)
 def get_short_address(address: str) -> str:
     """
     Get the last 6 characters of a formatted Bluetooth address.
@@ -655,8 +707,14 @@ def get_short_address(address: str) -> str:
         The last 6 characters of the formatted address.
 
     """
-    results = address.replace("-", ":").upper().split(":")
-    return f"{results[-3]}{results[-2]}{results[-1]}"[-6:]
+    return address.replace("-", "").replace(":", "")[-6:].upper()
+
+
+# Readable names are cosmetic; cache them briefly so discovery storms
+# (the same address reported by several adapters) do not repeat the
+# credential lookup each time.
+_READABLE_NAME_TTL = 60.0
+_readable_name_cache: dict[str, tuple[float, str]] = {}
 
 
 async def get_device_readable_name(
@@ -679,21 +737,37 @@ async def get_device_readable_name(
         A user-friendly device name including a short address suffix.
 
     """
+    address = discovery_info.address
+    now = time.monotonic()
+    cached = _readable_name_cache.get(address)
+    if cached is not None and now - cached[0] < _READABLE_NAME_TTL:
+        return cached[1]
+
     credentials: TuyaBLEDeviceCredentials | None = None
     product_info: TuyaBLEProductInfo | None = None
     if manager:
-        credentials = await manager.get_device_credentials(discovery_info.address)
+        credentials = await manager.get_device_credentials(address)
         if credentials:
             product_info = get_product_info_by_ids(
                 credentials.category,
                 credentials.product_id,
             )
-    short_address = get_short_address(discovery_info.address)
+    short_address = get_short_address(address)
     if product_info:
-        return f"{product_info.name} {short_address}"
-    if credentials:
-        return f"{credentials.device_name} {short_address}"
-    return f"{discovery_info.device.name} {short_address}"
+        name = f"{product_info.name} {short_address}"
+    elif credentials:
+        name = f"{credentials.device_name} {short_address}"
+    else:
+        # Leave the credential-less fallback uncached so the name heals
+        # as soon as a login resolves the product.
+        return f"{discovery_info.device.name} {short_address}"
+    _readable_name_cache[address] = (now, name)
+    return name
+
+
+# DeviceInfo built per device address, invalidated when the identifying
+# fields change (e.g. a firmware update reports a new version).
+_device_info_cache: dict[str, tuple[tuple[str | None, ...], DeviceInfo]] = {}
 
 
 def get_device_info(device: TuyaBLEDevice) -> DeviceInfo | None:
@@ -712,12 +786,23 @@ def get_device_info(device: TuyaBLEDevice) -> DeviceInfo | None:
         version info.
 
     """
+    fingerprint = (
+        device.product_id,
+        device.product_model,
+        device.device_version,
+        device.protocol_version,
+        device.hardware_version,
+    )
+    cached = _device_info_cache.get(device.address)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
     product_info = None
     if device.category and device.product_id:
         product_info = get_product_info_by_ids(device.category, device.product_id)
     product_name: str
     product_name = product_info.name if product_info else device.name
-    return DeviceInfo(
+    device_info = DeviceInfo(
         connections={(dr.CONNECTION_BLUETOOTH, device.address)},
         hw_version=device.hardware_version,
         identifiers={(DOMAIN, device.address)},
@@ -728,3 +813,5 @@ def get_device_info(device: TuyaBLEDevice) -> DeviceInfo | None:
         name=(f"{product_name} {get_short_address(device.address)}"),
         sw_version=(f"{device.device_version} (protocol {device.protocol_version})"),
     )
+    _device_info_cache[device.address] = (fingerprint, device_info)
+    return device_info
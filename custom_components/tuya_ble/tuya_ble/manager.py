@@ -12,7 +12,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class TuyaBLEDeviceCredentials:
     """
     Credentials for a Tuya BLE device.
@@ -47,8 +47,12 @@ class TuyaBLEDeviceCredentials:
     product_model: str | None
     product_name: str | None
 
-    def __str__(self) -> str:
-        """Return a string representation of the device credentials."""
+    def __repr__(self) -> str:
+        """Return a compact representation without secret fields."""
+        return f"TuyaBLEDeviceCredentials(product_id={self.product_id!r})"
+
+    def describe(self) -> str:
+        """Return the verbose, secret-masked form for debug logging."""
         return (
             "uuid: xxxxxxxxxxxxxxxx, "
             "local_key: xxxxxxxxxxxxxxxx, "
@@ -60,57 +64,6 @@ class TuyaBLEDeviceCredentials:
             f"product_name: {self.product_name}"
         )
 
-    @classmethod
-    def create(  # noqa: PLR0913
-        cls,
-        uuid: str,
-        local_key: str,
-        device_id: str,
-        category: str,
-        product_id: str,
-        device_name: str | None = None,
-        product_model: str | None = None,
-        product_name: str | None = None,
-    ) -> TuyaBLEDeviceCredentials:
-        """
-        Create device credentials from individual fields.
-
-        Parameters
-        ----------
-        uuid : str
-            The unique identifier of the device.
-        local_key : str
-            The local encryption key for the device.
-        device_id : str
-            The device identifier.
-        category : str
-            The device category.
-        product_id : str
-            The product identifier.
-        device_name : str | None, optional
-            The name of the device, by default None.
-        product_model : str | None, optional
-            The product model, by default None.
-        product_name : str | None, optional
-            The product name, by default None.
-
-        Returns
-        -------
-        TuyaBLEDeviceCredentials
-            The credentials object with the provided fields.
-
-        """
-        return cls(
-            uuid,
-            local_key,
-            device_id,
-            category,
-            product_id,
-            device_name,
-            product_model,
-            product_name,
-        )
-
 
 class AbstaractTuyaBLEDeviceManager(ABC):
     """Abstaract manager of the Tuya BLE devices credentials."""